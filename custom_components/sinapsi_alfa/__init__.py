@@ -15,9 +15,8 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
-    CONF_NAME,
     DOMAIN,
-    STARTUP_MESSAGE,
+    startup_message,
 )
 from .coordinator import SinapsiAlfaCoordinator
 
@@ -52,7 +51,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: SinapsiAlfaConfig
 
     if hass.data.get(DOMAIN) is None:
         hass.data.setdefault(DOMAIN, {})
-        _LOGGER.info(STARTUP_MESSAGE)
+        _LOGGER.info(startup_message())
     _LOGGER.debug(f"Setup config_entry for {DOMAIN}")
 
     # Initialise the coordinator that manages data updates from your api.
@@ -68,7 +67,7 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: SinapsiAlfaConfig
     # Change this to match how your api will know if connected or successful update
     if not coordinator.api.data["sn"]:
         raise ConfigEntryNotReady(
-            f"Timeout connecting to {config_entry.data.get(CONF_NAME)}"
+            f"Timeout connecting to {coordinator.conn_config.name}"
         )
 
     # Initialise a listener for config flow options changes.
@@ -104,7 +103,7 @@ async def async_update_device_registry(
         identifiers={(DOMAIN, coordinator.api.data["sn"])},
         manufacturer=coordinator.api.data["manufact"],
         model=coordinator.api.data["model"],
-        name=config_entry.data.get(CONF_NAME),
+        name=coordinator.conn_config.name,
         serial_number=coordinator.api.data["sn"],
         sw_version=None,
         via_device=None,
@@ -6,25 +6,53 @@ https://github.com/alexdelprete/ha-sinapsi-alfa
 import logging
 import socket
 import threading
+from collections.abc import Callable
+from typing import Any
 
 from getmac import getmac
-from homeassistant.components.sensor import SensorDeviceClass
 from pymodbus.client import ModbusTcpClient
-from pymodbus.constants import Endian
 from pymodbus.exceptions import ConnectionException, ModbusException
-from pymodbus.payload import BinaryPayloadDecoder
 
-from .const import MANUFACTURER, MODEL, SENSOR_ENTITIES
+from .const import (
+    BATCH_STRUCTS,
+    CALCULATED_SENSORS,
+    MANUFACTURER,
+    MODEL,
+    REGISTER_BATCHES,
+    SENSOR_PLAN,
+)
 from .helpers import unix_timestamp_to_iso8601_local_tz
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class ConnectionError(Exception):
+def _tempo_residuo_distacco(value: int, data: dict[str, Any]) -> int:
+    """Return the remaining disconnection time."""
+    # if distacco is 65535 set it to 0
+    return 0 if value == 65535 else value
+
+
+def _data_evento(value: int, data: dict[str, Any]) -> str:
+    """Return the event date as ISO8601."""
+    # if data_evento is > 4294967294 then no event
+    if value > 4294967294:
+        return "None"
+    # convert timestamp to ISO8601
+    return unix_timestamp_to_iso8601_local_tz(value + data["tempo_residuo_distacco"])
+
+
+# sensors whose converted value needs post-processing, by key
+_SPECIAL_VALUES: dict[str, Callable[[int, dict[str, Any]], Any]] = {
+    "tempo_residuo_distacco": _tempo_residuo_distacco,
+    "data_evento": _data_evento,
+}
+
+
+class SinapsiConnectionError(Exception):
     """Empty Error Class."""
 
 
-class ModbusError(Exception):
+class SinapsiModbusError(Exception):
     """Empty Error Class."""
 
 
@@ -109,11 +137,15 @@ class SinapsiAlfaAPI:
         while not mac_address and i < 10:
             if self.check_port():
                 _LOGGER.debug(
-                    f"Get_Mac_Address (SUCCESS): port open on {self._host}:{self._port}"
+                    "Get_Mac_Address (SUCCESS): port open on %s:%s",
+                    self._host,
+                    self._port,
                 )
             else:
                 _LOGGER.debug(
-                    f"Get_Mac_Address (ERROR): port not available on {self._host}:{self._port}"
+                    "Get_Mac_Address (ERROR): port not available on %s:%s",
+                    self._host,
+                    self._port,
                 )
             # Get MAC address from the ARP cache using the hostname
             mac_address = getmac.get_mac_address(
@@ -123,10 +155,12 @@ class SinapsiAlfaAPI:
         if mac_address is not None:
             # Remove colons and convert to uppercase
             mac_address = mac_address.replace(":", "").upper()
-            _LOGGER.debug(f"Get_Mac_Address (SUCCESS): found mac address {mac_address}")
+            _LOGGER.debug(
+                "Get_Mac_Address (SUCCESS): found mac address %s", mac_address
+            )
         else:
             _LOGGER.debug(
-                f"Get_Mac_Address (ERROR): mac address not found! {mac_address}"
+                "Get_Mac_Address (ERROR): mac address not found! %s", mac_address
             )
         return mac_address
 
@@ -135,7 +169,10 @@ class SinapsiAlfaAPI:
         with self._lock:
             sock_timeout = float(3)
             _LOGGER.debug(
-                f"Check_Port: opening socket on {self._host}:{self._port} with a {sock_timeout}s timeout."
+                "Check_Port: opening socket on %s:%s with a %ss timeout.",
+                self._host,
+                self._port,
+                sock_timeout,
             )
             socket.setdefaulttimeout(sock_timeout)
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -144,11 +181,14 @@ class SinapsiAlfaAPI:
             if is_open:
                 sock.shutdown(socket.SHUT_RDWR)
                 _LOGGER.debug(
-                    f"Check_Port (SUCCESS): port open on {self._host}:{self._port}"
+                    "Check_Port (SUCCESS): port open on %s:%s", self._host, self._port
                 )
             else:
                 _LOGGER.debug(
-                    f"Check_Port (ERROR): port not available on {self._host}:{self._port} - error: {sock_res}"
+                    "Check_Port (ERROR): port not available on %s:%s - error: %s",
+                    self._host,
+                    self._port,
+                    sock_res,
                 )
             sock.close()
         return is_open
@@ -164,13 +204,16 @@ class SinapsiAlfaAPI:
             else:
                 _LOGGER.debug("Modbus TCP connection already closed")
         except ConnectionException as connect_error:
-            _LOGGER.debug(f"Close Connection connect_error: {connect_error}")
-            raise ConnectionError() from connect_error
+            _LOGGER.debug("Close Connection connect_error: %s", connect_error)
+            raise SinapsiConnectionError(str(connect_error)) from connect_error
 
     def connect(self):
         """Connect client."""
         _LOGGER.debug(
-            f"API Client connect to IP: {self._host} port: {self._port} timeout: {self._timeout}"
+            "API Client connect to IP: %s port: %s timeout: %s",
+            self._host,
+            self._port,
+            self._timeout,
         )
         if self.check_port():
             _LOGGER.debug("Inverter ready for Modbus TCP connection")
@@ -178,19 +221,21 @@ class SinapsiAlfaAPI:
                 with self._lock:
                     self._client.connect()
                 if not self._client.connected:
-                    raise ConnectionError(
+                    raise SinapsiConnectionError(
                         f"Failed to connect to {self._host}:{self._port} timeout: {self._timeout}"
                     )
                 else:
                     _LOGGER.debug("Modbus TCP Client connected")
                     return True
             except ModbusException:
-                raise ConnectionError(
+                raise SinapsiConnectionError(
                     f"Failed to connect to {self._host}:{self._port} timeout: {self._timeout}"
                 )
         else:
             _LOGGER.debug("Inverter not ready for Modbus TCP connection")
-            raise ConnectionError(f"Inverter not active on {self._host}:{self._port}")
+            raise SinapsiConnectionError(
+                f"Inverter not active on {self._host}:{self._port}"
+            )
 
     def read_holding_registers(self, address, count):
         """Read holding registers."""
@@ -199,115 +244,100 @@ class SinapsiAlfaAPI:
             with self._lock:
                 return self._client.read_holding_registers(address, count, **kwargs)
         except ConnectionException as connect_error:
-            _LOGGER.debug(f"Read Holding Registers connect_error: {connect_error}")
-            raise ConnectionError() from connect_error
+            _LOGGER.debug("Read Holding Registers connect_error: %s", connect_error)
+            raise SinapsiConnectionError(str(connect_error)) from connect_error
         except ModbusException as modbus_error:
-            _LOGGER.debug(f"Read Holding Registers modbus_error: {modbus_error}")
-            raise ModbusError() from modbus_error
+            _LOGGER.debug("Read Holding Registers modbus_error: %s", modbus_error)
+            raise SinapsiModbusError(str(modbus_error)) from modbus_error
 
-    async def async_get_data(self):
+    async def async_get_data(self, poll_slow: bool = True):
         """Read Data Function."""
 
         try:
-            if self.connect():
-                _LOGGER.debug(
-                    "Start Get data (Host: %s - Port: %s)",
-                    self._host,
-                    self._port,
-                )
-                # HA way to call a sync function from async function
-                # https://developers.home-assistant.io/docs/asyncio_working_with_async?#calling-sync-functions-from-async
-                result = await self._hass.async_add_executor_job(self.read_modbus_alfa)
-                self.close()
-                _LOGGER.debug("End Get data")
-                if result:
-                    _LOGGER.debug("Get Data Result: valid")
-                    return True
-                else:
-                    _LOGGER.debug("Get Data Result: invalid")
-                    return False
-            else:
-                _LOGGER.debug("Get Data failed: client not connected")
-                return False
+            # HA way to call a sync function from async function
+            # https://developers.home-assistant.io/docs/asyncio_working_with_async?#calling-sync-functions-from-async
+            result = await self._hass.async_add_executor_job(self.get_data, poll_slow)
         except ConnectionException as connect_error:
-            _LOGGER.debug(f"Async Get Data connect_error: {connect_error}")
-            raise ConnectionError() from connect_error
+            _LOGGER.debug("Async Get Data connect_error: %s", connect_error)
+            raise SinapsiConnectionError(str(connect_error)) from connect_error
         except ModbusException as modbus_error:
-            _LOGGER.debug(f"Async Get Data modbus_error: {modbus_error}")
-            raise ModbusError() from modbus_error
+            _LOGGER.debug("Async Get Data modbus_error: %s", modbus_error)
+            raise SinapsiModbusError(str(modbus_error)) from modbus_error
+        _LOGGER.debug("End Get data")
+        if result:
+            _LOGGER.debug("Get Data Result: valid")
+            return True
+        else:
+            _LOGGER.debug("Get Data Result: invalid")
+            return False
 
-    def read_modbus_alfa(self):
+    def get_data(self, poll_slow: bool = True):
+        """Connect, read Alfa modbus registers and disconnect."""
+        # port check, connect and close are blocking socket calls too: they
+        # run in the same executor job as the reads, never on the event loop
+        if not self.connect():
+            _LOGGER.debug("Get Data failed: client not connected")
+            return False
+        _LOGGER.debug("Start Get data (Host: %s - Port: %s)", self._host, self._port)
+        try:
+            # the device serves one request at a time on the connection,
+            # so the register blocks are still read sequentially
+            return self.read_modbus_alfa(poll_slow)
+        finally:
+            self.close()
+
+    def read_modbus_alfa(self, poll_slow: bool = True):
         """Read Alfa modbus registers."""
         try:
             result = True
-            for sensor in SENSOR_ENTITIES:
-                reg_key = sensor["key"]
-                reg_dev_class = sensor["device_class"]
-                reg_type = sensor["modbus_type"]
-                reg_addr = sensor["modbus_addr"]
-                reg_count = 1 if reg_type == "uint16" else 2
-                _LOGGER.debug(
-                    f"(read_modbus_alfa) Key: {reg_key} Addr: {reg_addr} Type: {reg_type} DevClass: {reg_dev_class}"
-                )
-                if reg_type == "calcolato":
-                    self.data["potenza_auto_consumata"] = (
-                        self.data["potenza_prodotta"] - self.data["potenza_immessa"]
-                    )
-                    self.data["potenza_consumata"] = (
-                        self.data["potenza_auto_consumata"]
-                        + self.data["potenza_prelevata"]
-                    )
+            # read each register block with a single request
+            batches = []
+            for (address, count, tier), batch_struct in zip(
+                REGISTER_BATCHES, BATCH_STRUCTS, strict=True
+            ):
+                if tier == "slow" and not poll_slow:
+                    # keep the values read on the last slow poll
+                    batches.append(None)
+                    continue
+                read_data = self.read_holding_registers(address=address, count=count)
+                # registers are big-endian words: decode them from one buffer
+                batches.append(batch_struct.pack(*read_data.registers))
 
-                    self.data["energia_auto_consumata"] = (
-                        self.data["energia_prodotta"] - self.data["energia_immessa"]
-                    )
-                    self.data["energia_consumata"] = (
-                        self.data["energia_auto_consumata"]
-                        + self.data["energia_prelevata"]
-                    )
-                else:
-                    read_data = self.read_holding_registers(
-                        address=reg_addr, count=reg_count
-                    )
-                    # No connection errors, we can start scraping registers
-                    decoder = BinaryPayloadDecoder.fromRegisters(
-                        read_data.registers, byteorder=Endian.BIG
+            # No connection errors, we can start decoding registers
+            # check the log level once: the loop logs three lines per sensor
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
+            for sensor, batch_idx, offset, decode, convert in SENSOR_PLAN:
+                payload = batches[batch_idx]
+                if payload is None:
+                    continue
+                reg_key = sensor.key
+                (value,) = decode(payload, offset)
+                if debug:
+                    _LOGGER.debug(
+                        "(read_modbus_alfa) Key: %s Addr: %s Type: %s DevClass: %s",
+                        reg_key,
+                        sensor.modbus_addr,
+                        sensor.modbus_type,
+                        sensor.device_class,
                     )
+                    _LOGGER.debug("(read_modbus_alfa) Raw Value: %s", value)
+
+                # kW/kWh scaling or int cast, picked per sensor at import
+                value = convert(value)
+
+                # one dict lookup finds the few sensors with special values
+                special_value = _SPECIAL_VALUES.get(reg_key)
+                if special_value is not None:
+                    value = special_value(value, self.data)
+                self.data[reg_key] = value
+                if debug:
+                    _LOGGER.debug("(read_modbus_alfa) Data: %s", value)
 
-                    # decode the register based on type
-                    if reg_type == "uint16":
-                        value = round(float(decoder.decode_16bit_uint()), 2)
-                    elif reg_type == "uint32":
-                        value = round(float(decoder.decode_32bit_uint()), 2)
-                    _LOGGER.debug(f"(read_modbus_alfa) Raw Value: {value}")
-
-                    # Alfa provides power/energy data in W/Wh, we want kW/kWh
-                    if reg_dev_class in [
-                        SensorDeviceClass.ENERGY,
-                        SensorDeviceClass.POWER,
-                    ]:
-                        value = round(float(value / 1000), 2)
-                    # if not power/energy type, it's an integer
-                    else:
-                        value = int(value)
-
-                    # if distacco is 65535 set it to 0
-                    if reg_key == "tempo_residuo_distacco":
-                        if value == 65535:
-                            value = 0
-                    # if data_evento is > 4294967294 then no event
-                    if reg_key == "data_evento":
-                        if value > 4294967294:
-                            value = "None"
-                        else:
-                            # convert timestamp to ISO8601
-                            value = unix_timestamp_to_iso8601_local_tz(
-                                value + self.data["tempo_residuo_distacco"]
-                            )
-                    self.data[reg_key] = value
-                    _LOGGER.debug(f"(read_modbus_alfa) Data: {self.data[reg_key]}")
+            # calculated values
+            for sensor in CALCULATED_SENSORS:
+                self.data[sensor.key] = sensor.compute(self.data)
         except Exception as modbus_error:
-            _LOGGER.debug(f"(read_modbus_alfa): failed with error: {modbus_error}")
+            _LOGGER.debug("(read_modbus_alfa): failed with error: %s", modbus_error)
             result = False
-            raise ModbusError() from modbus_error
+            raise SinapsiModbusError(str(modbus_error)) from modbus_error
         return result
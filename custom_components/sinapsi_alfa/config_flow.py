@@ -23,6 +23,8 @@ from .const import (
     DEFAULT_PORT,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
 )
 from .helpers import host_valid
 
@@ -33,7 +35,7 @@ _LOGGER = logging.getLogger(__name__)
 def get_host_from_config(hass: HomeAssistant):
     """Return the hosts already configured."""
     return {
-        config_entry.data.get(CONF_HOST)
+        config_entry.data[CONF_HOST]
         for config_entry in hass.config_entries.async_entries(DOMAIN)
     }
 
@@ -122,8 +124,8 @@ class SinapsiAlfaConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     ): selector(
                         {
                             "number": {
-                                "min": 30,
-                                "max": 600,
+                                "min": MIN_SCAN_INTERVAL,
+                                "max": MAX_SCAN_INTERVAL,
                                 "step": 10,
                                 "unit_of_measurement": "s",
                                 "mode": "slider",
@@ -144,20 +146,21 @@ class SinapsiAlfaOptionsFlow(config_entries.OptionsFlow):
     def __init__(self, config_entry: ConfigEntry) -> None:
         """Initialize option flow instance."""
         self.config_entry = config_entry
+        data = config_entry.data
         self.data_schema = vol.Schema(
             {
                 vol.Required(
                     CONF_PORT,
-                    default=self.config_entry.data.get(CONF_PORT),
+                    default=data[CONF_PORT],
                 ): vol.Coerce(int),
                 vol.Required(
                     CONF_SCAN_INTERVAL,
-                    default=self.config_entry.data.get(CONF_SCAN_INTERVAL),
+                    default=data.get(CONF_SCAN_INTERVAL),
                 ): selector(
                     {
                         "number": {
-                            "min": 30,
-                            "max": 600,
+                            "min": MIN_SCAN_INTERVAL,
+                            "max": MAX_SCAN_INTERVAL,
                             "step": 10,
                             "unit_of_measurement": "s",
                             "mode": "slider",
@@ -172,10 +175,11 @@ class SinapsiAlfaOptionsFlow(config_entries.OptionsFlow):
 
         if user_input is not None:
             # complete non-edited entries before update (ht @PeteRage)
-            if CONF_NAME in self.config_entry.data:
-                user_input[CONF_NAME] = self.config_entry.data.get(CONF_NAME)
-            if CONF_HOST in self.config_entry.data:
-                user_input[CONF_HOST] = self.config_entry.data.get(CONF_HOST)
+            data = self.config_entry.data
+            if CONF_NAME in data:
+                user_input[CONF_NAME] = data[CONF_NAME]
+            if CONF_HOST in data:
+                user_input[CONF_HOST] = data[CONF_HOST]
 
             # write updated config entries (ht @PeteRage / @fuatakgun)
             self.hass.config_entries.async_update_entry(
@@ -3,6 +3,11 @@
 https://github.com/alexdelprete/ha-sinapsi-alfa
 """
 
+import struct
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import UnitOfEnergy, UnitOfPower
 
@@ -21,10 +26,15 @@ DEFAULT_NAME = "Alfa"
 DEFAULT_PORT = 502
 DEFAULT_SCAN_INTERVAL = 60
 MIN_SCAN_INTERVAL = 30
+MAX_SCAN_INTERVAL = 600
 CONN_TIMEOUT = 5
 MANUFACTURER = "Sinapsi"
 MODEL = "Alfa"
-STARTUP_MESSAGE = f"""
+
+
+def startup_message() -> str:
+    """Return the message logged when the integration starts."""
+    return f"""
 -------------------------------------------------------------------
 {NAME}
 {ATTRIBUTION}
@@ -34,276 +44,375 @@ If you have any issues with this you need to open an issue here:
 -------------------------------------------------------------------
 """
 
+
+@dataclass(frozen=True, slots=True)
+class SensorSpec:
+    """Immutable definition of a sensor entity and its Modbus source."""
+
+    name: str
+    key: str
+    icon: str
+    device_class: SensorDeviceClass | None
+    state_class: SensorStateClass | None
+    unit: str | None
+    modbus_type: str
+    modbus_addr: int | None
+    # derives the value of a "calcolato" sensor from the modbus sensors data
+    compute: Callable[[dict[str, Any]], float] | None = None
+
+
 # Sensor definitions
-SENSOR_ENTITIES = [
-    {
-        "name": "Potenza Prelevata",
-        "key": "potenza_prelevata",
-        "icon": "mdi:transmission-tower-import",
-        "device_class": SensorDeviceClass.POWER,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "unit": UnitOfPower.KILO_WATT,
-        "modbus_type": "uint16",
-        "modbus_addr": 2,
-    },
-    {
-        "name": "Potenza Prelevata Media 15m",
-        "key": "potenza_prelevata_media_15m",
-        "icon": "mdi:transmission-tower-import",
-        "device_class": SensorDeviceClass.POWER,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "unit": UnitOfPower.KILO_WATT,
-        "modbus_type": "uint16",
-        "modbus_addr": 9,
-    },
-    {
-        "name": "Potenza Immessa",
-        "key": "potenza_immessa",
-        "icon": "mdi:transmission-tower-export",
-        "device_class": SensorDeviceClass.POWER,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "unit": UnitOfPower.KILO_WATT,
-        "modbus_type": "uint16",
-        "modbus_addr": 12,
-    },
-    {
-        "name": "Potenza Immessa Media 15m",
-        "key": "potenza_immessa_media_15m",
-        "icon": "mdi:transmission-tower-export",
-        "device_class": SensorDeviceClass.POWER,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "unit": UnitOfPower.KILO_WATT,
-        "modbus_type": "uint16",
-        "modbus_addr": 19,
-    },
-    {
-        "name": "Potenza Prodotta",
-        "key": "potenza_prodotta",
-        "icon": "mdi:solar-power-variant-outline",
-        "device_class": SensorDeviceClass.POWER,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "unit": UnitOfPower.KILO_WATT,
-        "modbus_type": "uint16",
-        "modbus_addr": 921,
-    },
-    {
-        "name": "Energia Prelevata",
-        "key": "energia_prelevata",
-        "icon": "mdi:transmission-tower-import",
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "modbus_type": "uint32",
-        "modbus_addr": 5,
-    },
-    {
-        "name": "Energia Immessa",
-        "key": "energia_immessa",
-        "icon": "mdi:transmission-tower-export",
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "modbus_type": "uint32",
-        "modbus_addr": 15,
-    },
-    {
-        "name": "Energia Prodotta",
-        "key": "energia_prodotta",
-        "icon": "mdi:solar-power-variant-outline",
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "modbus_type": "uint32",
-        "modbus_addr": 924,
-    },
-    {
-        "name": "Energia Prelevata Giornaliera F1",
-        "key": "energia_prelevata_giornaliera_f1",
-        "icon": "mdi:transmission-tower-import",
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "modbus_type": "uint32",
-        "modbus_addr": 30,
-    },
-    {
-        "name": "Energia Prelevata Giornaliera F2",
-        "key": "energia_prelevata_giornaliera_f2",
-        "icon": "mdi:transmission-tower-import",
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "modbus_type": "uint32",
-        "modbus_addr": 32,
-    },
-    {
-        "name": "Energia Prelevata Giornaliera F3",
-        "key": "energia_prelevata_giornaliera_f3",
-        "icon": "mdi:transmission-tower-import",
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "modbus_type": "uint32",
-        "modbus_addr": 34,
-    },
-    {
-        "name": "Energia Prelevata Giornaliera F4",
-        "key": "energia_prelevata_giornaliera_f4",
-        "icon": "mdi:transmission-tower-import",
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "modbus_type": "uint32",
-        "modbus_addr": 36,
-    },
-    {
-        "name": "Energia Prelevata Giornaliera F5",
-        "key": "energia_prelevata_giornaliera_f5",
-        "icon": "mdi:transmission-tower-import",
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "modbus_type": "uint32",
-        "modbus_addr": 38,
-    },
-    {
-        "name": "Energia Prelevata Giornaliera F6",
-        "key": "energia_prelevata_giornaliera_f6",
-        "icon": "mdi:transmission-tower-import",
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "modbus_type": "uint32",
-        "modbus_addr": 40,
-    },
-    {
-        "name": "Energia Immessa Giornaliera F1",
-        "key": "energia_immessa_giornaliera_f1",
-        "icon": "mdi:transmission-tower-export",
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "modbus_type": "uint32",
-        "modbus_addr": 54,
-    },
-    {
-        "name": "Energia Immessa Giornaliera F2",
-        "key": "energia_immessa_giornaliera_f2",
-        "icon": "mdi:transmission-tower-export",
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "modbus_type": "uint32",
-        "modbus_addr": 56,
-    },
-    {
-        "name": "Energia Immessa Giornaliera F3",
-        "key": "energia_immessa_giornaliera_f3",
-        "icon": "mdi:transmission-tower-export",
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "modbus_type": "uint32",
-        "modbus_addr": 58,
-    },
-    {
-        "name": "Energia Immessa Giornaliera F4",
-        "key": "energia_immessa_giornaliera_f4",
-        "icon": "mdi:transmission-tower-export",
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "modbus_type": "uint32",
-        "modbus_addr": 60,
-    },
-    {
-        "name": "Energia Immessa Giornaliera F5",
-        "key": "energia_immessa_giornaliera_f5",
-        "icon": "mdi:transmission-tower-export",
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "modbus_type": "uint32",
-        "modbus_addr": 62,
-    },
-    {
-        "name": "Energia Immessa Giornaliera F6",
-        "key": "energia_immessa_giornaliera_f6",
-        "icon": "mdi:transmission-tower-export",
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "modbus_type": "uint32",
-        "modbus_addr": 64,
-    },
-    {
-        "name": "Fascia Oraria Attuale",
-        "key": "fascia_oraria_attuale",
-        "icon": "mdi:information-outline",
-        "device_class": None,
-        "state_class": None,
-        "unit": None,
-        "modbus_type": "uint16",
-        "modbus_addr": 203,
-    },
-    {
-        "name": "Tempo Residuo Distacco",
-        "key": "tempo_residuo_distacco",
-        "icon": "mdi:timer-outline",
-        "device_class": None,
-        "state_class": None,
-        "unit": None,
-        "modbus_type": "uint16",
-        "modbus_addr": 782,
-    },
-    {
-        "name": "Data Evento",
-        "key": "data_evento",
-        "icon": "mdi:calendar-outline",
-        "device_class": None,
-        "state_class": None,
-        "unit": None,
-        "modbus_type": "uint32",
-        "modbus_addr": 780,
-    },
-    {
-        "name": "Potenza Consumata",
-        "key": "potenza_consumata",
-        "icon": "mdi:home-lightning-bolt-outline",
-        "device_class": SensorDeviceClass.POWER,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "unit": UnitOfPower.KILO_WATT,
-        "modbus_type": "calcolato",
-        "modbus_addr": None,
-    },
-    {
-        "name": "Potenza Auto Consumata",
-        "key": "potenza_auto_consumata",
-        "icon": "mdi:home-lightning-bolt-outline",
-        "device_class": SensorDeviceClass.POWER,
-        "state_class": SensorStateClass.MEASUREMENT,
-        "unit": UnitOfPower.KILO_WATT,
-        "modbus_type": "calcolato",
-        "modbus_addr": None,
-    },
-    {
-        "name": "Energia Consumata",
-        "key": "energia_consumata",
-        "icon": "mdi:home-lightning-bolt-outline",
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "modbus_type": "calcolato",
-        "modbus_addr": None,
-    },
-    {
-        "name": "Energia Auto Consumata",
-        "key": "energia_auto_consumata",
-        "icon": "mdi:home-lightning-bolt-outline",
-        "device_class": SensorDeviceClass.ENERGY,
-        "state_class": SensorStateClass.TOTAL_INCREASING,
-        "unit": UnitOfEnergy.KILO_WATT_HOUR,
-        "modbus_type": "calcolato",
-        "modbus_addr": None,
-    },
-]
+SENSOR_ENTITIES: tuple[SensorSpec, ...] = (
+    SensorSpec(
+        name="Potenza Prelevata",
+        key="potenza_prelevata",
+        icon="mdi:transmission-tower-import",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        unit=UnitOfPower.KILO_WATT,
+        modbus_type="uint16",
+        modbus_addr=2,
+    ),
+    SensorSpec(
+        name="Potenza Prelevata Media 15m",
+        key="potenza_prelevata_media_15m",
+        icon="mdi:transmission-tower-import",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        unit=UnitOfPower.KILO_WATT,
+        modbus_type="uint16",
+        modbus_addr=9,
+    ),
+    SensorSpec(
+        name="Potenza Immessa",
+        key="potenza_immessa",
+        icon="mdi:transmission-tower-export",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        unit=UnitOfPower.KILO_WATT,
+        modbus_type="uint16",
+        modbus_addr=12,
+    ),
+    SensorSpec(
+        name="Potenza Immessa Media 15m",
+        key="potenza_immessa_media_15m",
+        icon="mdi:transmission-tower-export",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        unit=UnitOfPower.KILO_WATT,
+        modbus_type="uint16",
+        modbus_addr=19,
+    ),
+    SensorSpec(
+        name="Potenza Prodotta",
+        key="potenza_prodotta",
+        icon="mdi:solar-power-variant-outline",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        unit=UnitOfPower.KILO_WATT,
+        modbus_type="uint16",
+        modbus_addr=921,
+    ),
+    SensorSpec(
+        name="Energia Prelevata",
+        key="energia_prelevata",
+        icon="mdi:transmission-tower-import",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        modbus_type="uint32",
+        modbus_addr=5,
+    ),
+    SensorSpec(
+        name="Energia Immessa",
+        key="energia_immessa",
+        icon="mdi:transmission-tower-export",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        modbus_type="uint32",
+        modbus_addr=15,
+    ),
+    SensorSpec(
+        name="Energia Prodotta",
+        key="energia_prodotta",
+        icon="mdi:solar-power-variant-outline",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        modbus_type="uint32",
+        modbus_addr=924,
+    ),
+    SensorSpec(
+        name="Energia Prelevata Giornaliera F1",
+        key="energia_prelevata_giornaliera_f1",
+        icon="mdi:transmission-tower-import",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        modbus_type="uint32",
+        modbus_addr=30,
+    ),
+    SensorSpec(
+        name="Energia Prelevata Giornaliera F2",
+        key="energia_prelevata_giornaliera_f2",
+        icon="mdi:transmission-tower-import",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        modbus_type="uint32",
+        modbus_addr=32,
+    ),
+    SensorSpec(
+        name="Energia Prelevata Giornaliera F3",
+        key="energia_prelevata_giornaliera_f3",
+        icon="mdi:transmission-tower-import",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        modbus_type="uint32",
+        modbus_addr=34,
+    ),
+    SensorSpec(
+        name="Energia Prelevata Giornaliera F4",
+        key="energia_prelevata_giornaliera_f4",
+        icon="mdi:transmission-tower-import",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        modbus_type="uint32",
+        modbus_addr=36,
+    ),
+    SensorSpec(
+        name="Energia Prelevata Giornaliera F5",
+        key="energia_prelevata_giornaliera_f5",
+        icon="mdi:transmission-tower-import",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        modbus_type="uint32",
+        modbus_addr=38,
+    ),
+    SensorSpec(
+        name="Energia Prelevata Giornaliera F6",
+        key="energia_prelevata_giornaliera_f6",
+        icon="mdi:transmission-tower-import",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        modbus_type="uint32",
+        modbus_addr=40,
+    ),
+    SensorSpec(
+        name="Energia Immessa Giornaliera F1",
+        key="energia_immessa_giornaliera_f1",
+        icon="mdi:transmission-tower-export",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        modbus_type="uint32",
+        modbus_addr=54,
+    ),
+    SensorSpec(
+        name="Energia Immessa Giornaliera F2",
+        key="energia_immessa_giornaliera_f2",
+        icon="mdi:transmission-tower-export",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        modbus_type="uint32",
+        modbus_addr=56,
+    ),
+    SensorSpec(
+        name="Energia Immessa Giornaliera F3",
+        key="energia_immessa_giornaliera_f3",
+        icon="mdi:transmission-tower-export",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        modbus_type="uint32",
+        modbus_addr=58,
+    ),
+    SensorSpec(
+        name="Energia Immessa Giornaliera F4",
+        key="energia_immessa_giornaliera_f4",
+        icon="mdi:transmission-tower-export",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        modbus_type="uint32",
+        modbus_addr=60,
+    ),
+    SensorSpec(
+        name="Energia Immessa Giornaliera F5",
+        key="energia_immessa_giornaliera_f5",
+        icon="mdi:transmission-tower-export",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        modbus_type="uint32",
+        modbus_addr=62,
+    ),
+    SensorSpec(
+        name="Energia Immessa Giornaliera F6",
+        key="energia_immessa_giornaliera_f6",
+        icon="mdi:transmission-tower-export",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        modbus_type="uint32",
+        modbus_addr=64,
+    ),
+    SensorSpec(
+        name="Fascia Oraria Attuale",
+        key="fascia_oraria_attuale",
+        icon="mdi:information-outline",
+        device_class=None,
+        state_class=None,
+        unit=None,
+        modbus_type="uint16",
+        modbus_addr=203,
+    ),
+    SensorSpec(
+        name="Tempo Residuo Distacco",
+        key="tempo_residuo_distacco",
+        icon="mdi:timer-outline",
+        device_class=None,
+        state_class=None,
+        unit=None,
+        modbus_type="uint16",
+        modbus_addr=782,
+    ),
+    SensorSpec(
+        name="Data Evento",
+        key="data_evento",
+        icon="mdi:calendar-outline",
+        device_class=None,
+        state_class=None,
+        unit=None,
+        modbus_type="uint32",
+        modbus_addr=780,
+    ),
+    SensorSpec(
+        name="Potenza Consumata",
+        key="potenza_consumata",
+        icon="mdi:home-lightning-bolt-outline",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        unit=UnitOfPower.KILO_WATT,
+        modbus_type="calcolato",
+        modbus_addr=None,
+        compute=lambda data: (
+            data["potenza_prodotta"]
+            - data["potenza_immessa"]
+            + data["potenza_prelevata"]
+        ),
+    ),
+    SensorSpec(
+        name="Potenza Auto Consumata",
+        key="potenza_auto_consumata",
+        icon="mdi:home-lightning-bolt-outline",
+        device_class=SensorDeviceClass.POWER,
+        state_class=SensorStateClass.MEASUREMENT,
+        unit=UnitOfPower.KILO_WATT,
+        modbus_type="calcolato",
+        modbus_addr=None,
+        compute=lambda data: data["potenza_prodotta"] - data["potenza_immessa"],
+    ),
+    SensorSpec(
+        name="Energia Consumata",
+        key="energia_consumata",
+        icon="mdi:home-lightning-bolt-outline",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        modbus_type="calcolato",
+        modbus_addr=None,
+        compute=lambda data: (
+            data["energia_prodotta"]
+            - data["energia_immessa"]
+            + data["energia_prelevata"]
+        ),
+    ),
+    SensorSpec(
+        name="Energia Auto Consumata",
+        key="energia_auto_consumata",
+        icon="mdi:home-lightning-bolt-outline",
+        device_class=SensorDeviceClass.ENERGY,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        modbus_type="calcolato",
+        modbus_addr=None,
+        compute=lambda data: data["energia_prodotta"] - data["energia_immessa"],
+    ),
+)
+
+MODBUS_SENSORS: tuple[SensorSpec, ...] = tuple(
+    sensor for sensor in SENSOR_ENTITIES if sensor.modbus_type != "calcolato"
+)
+CALCULATED_SENSORS: tuple[SensorSpec, ...] = tuple(
+    sensor for sensor in SENSOR_ENTITIES if sensor.modbus_type == "calcolato"
+)
+
+# Modbus holding register blocks, each read with a single request:
+# (address, count, tier) - "fast" blocks are read on every poll, "slow" blocks
+# (values that change over minutes) only every SLOW_POLL_MULTIPLIER polls
+# every modbus sensor address above must fall inside one of these blocks
+REGISTER_BATCHES: tuple[tuple[int, int, str], ...] = (
+    (2, 18, "fast"),  # 2-19: potenza/energia prelevata e immessa
+    (30, 36, "slow"),  # 30-65: energia prelevata/immessa giornaliera F1-F6
+    (203, 1, "fast"),  # 203: fascia oraria attuale
+    (780, 3, "fast"),  # 780-782: data evento, tempo residuo distacco
+    (921, 5, "fast"),  # 921-925: potenza/energia prodotta
+)
+SLOW_POLL_MULTIPLIER = 5
+# big-endian word packers for each register block, aligned with REGISTER_BATCHES
+BATCH_STRUCTS: tuple[struct.Struct, ...] = tuple(
+    struct.Struct(f">{count}H") for _, count, _ in REGISTER_BATCHES
+)
+
+# decoders unpack a big-endian value at a byte offset of a register block payload
+type SensorDecoder = Callable[[bytes, int], tuple[int]]
+
+_DECODERS: dict[str, SensorDecoder] = {
+    "uint16": struct.Struct(">H").unpack_from,
+    "uint32": struct.Struct(">I").unpack_from,
+}
+
+# register address -> (batch index, byte offset inside the batch payload)
+_ADDR_TO_BATCH: dict[int, tuple[int, int]] = {
+    address: (batch_idx, 2 * (address - start))
+    for batch_idx, (start, count, _) in enumerate(REGISTER_BATCHES)
+    for address in range(start, start + count)
+}
+
+# converters turn a decoded register value into the sensor's native value
+type SensorConverter = Callable[[int], float | int]
+
+
+def _to_kilo(value: int) -> float:
+    """Convert a W/Wh register value to kW/kWh."""
+    return round(value / 1000, 2)
+
+
+def _converter(sensor: SensorSpec) -> SensorConverter:
+    """Return the value converter of a modbus sensor."""
+    # Alfa provides power/energy data in W/Wh, we want kW/kWh
+    if sensor.device_class in (SensorDeviceClass.ENERGY, SensorDeviceClass.POWER):
+        return _to_kilo
+    # if not power/energy type, it's an integer
+    return int
+
+
+# Read plan for modbus sensors: (sensor, batch index, byte offset, decoder, converter)
+type SensorReadStep = tuple[SensorSpec, int, int, SensorDecoder, SensorConverter]
+
+SENSOR_PLAN: tuple[SensorReadStep, ...] = tuple(
+    (
+        sensor,
+        *_ADDR_TO_BATCH[sensor.modbus_addr],
+        _DECODERS[sensor.modbus_type],
+        _converter(sensor),
+    )
+    for sensor in MODBUS_SENSORS
+)
@@ -3,14 +3,20 @@
 https://github.com/alexdelprete/ha-sinapsi-alfa
 """
 
+import asyncio
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .api import SinapsiAlfaAPI
+from .api import SinapsiAlfaAPI, SinapsiConnectionError, SinapsiModbusError
 from .const import (
     CONF_HOST,
     CONF_NAME,
@@ -18,12 +24,47 @@ from .const import (
     CONF_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    MAX_SCAN_INTERVAL,
     MIN_SCAN_INTERVAL,
+    SLOW_POLL_MULTIPLIER,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _clamped_interval(scan_interval: int) -> timedelta:
+    """Return the update interval for scan_interval within its bounds."""
+    return timedelta(
+        seconds=max(MIN_SCAN_INTERVAL, min(MAX_SCAN_INTERVAL, scan_interval))
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ConnectionConfig:
+    """Typed connection settings of a config entry."""
+
+    name: str
+    host: str
+    port: int
+    scan_interval: int
+
+
+@lru_cache(maxsize=16)
+def _connection_config(entry_data: frozenset[tuple[str, Any]]) -> ConnectionConfig:
+    """Return the connection settings parsed from config entry data."""
+    data = dict(entry_data)
+    update_interval = _clamped_interval(
+        int(data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+    )
+    return ConnectionConfig(
+        name=data[CONF_NAME],
+        host=data[CONF_HOST],
+        port=int(data[CONF_PORT]),
+        scan_interval=int(update_interval.total_seconds()),
+    )
+
+
 class SinapsiAlfaCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
 
@@ -32,17 +73,15 @@ class SinapsiAlfaCoordinator(DataUpdateCoordinator):
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
         """Initialize data update coordinator."""
 
-        # get scan_interval from user config
-        self.scan_interval = config_entry.data.get(
-            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
-        )
-        # enforce scan_interval lower bound
-        if self.scan_interval < MIN_SCAN_INTERVAL:
-            self.scan_interval = MIN_SCAN_INTERVAL
+        # get typed connection settings from user config
+        self.conn_config = _connection_config(frozenset(config_entry.data.items()))
         # set coordinator update interval
-        self.update_interval = timedelta(seconds=self.scan_interval)
+        self.scan_interval = self.conn_config.scan_interval
+        self.update_interval = _clamped_interval(self.scan_interval)
         _LOGGER.debug(
-            f"Scan Interval: scan_interval={self.scan_interval} update_interval={self.update_interval}"
+            "Scan Interval: scan_interval=%s update_interval=%s",
+            self.scan_interval,
+            self.update_interval,
         )
 
         # set update method and interval for coordinator
@@ -54,36 +93,88 @@ class SinapsiAlfaCoordinator(DataUpdateCoordinator):
             update_interval=self.update_interval,
         )
 
-        self.last_update_time = datetime.now()
+        # None until the first successful update
+        self.last_update_time: datetime | None = None
         self.last_update_success = True
+        # successful polls so far, used to schedule the slow register blocks
+        self._poll_count = 0
+        # failed polls in a row, used to back off the update interval
+        self._consecutive_failures = 0
+        # update in progress, shared by overlapping refresh requests
+        self._inflight: asyncio.Task | None = None
 
         self.api = SinapsiAlfaAPI(
             hass,
-            config_entry.data.get(CONF_NAME),
-            config_entry.data.get(CONF_HOST),
-            config_entry.data.get(CONF_PORT),
+            self.conn_config.name,
+            self.conn_config.host,
+            self.conn_config.port,
             self.scan_interval,
         )
+        # device attributes are the same for every entity, build them once
+        self.device_info = DeviceInfo(
+            configuration_url=f"http://{self.api.host}",
+            identifiers={(DOMAIN, self.api.data["sn"])},
+            manufacturer=self.api.data["manufact"],
+            model=self.api.data["model"],
+            name=self.api.name,
+            serial_number=self.api.data["sn"],
+        )
 
         _LOGGER.debug("Coordinator Config Data: %s", config_entry.data)
         _LOGGER.debug(
-            "Coordinator API init: Host: %s Port: %s ID: %s ScanInterval: %s",
-            config_entry.data.get(CONF_HOST),
-            config_entry.data.get(CONF_PORT),
+            "Coordinator API init: Host: %s Port: %s ScanInterval: %s",
+            self.conn_config.host,
+            self.conn_config.port,
             self.scan_interval,
         )
 
     async def async_update_data(self):
         """Update data method."""
-        _LOGGER.debug(f"Data Coordinator: Update started at {datetime.now()}")
+        # overlapping refreshes join the update already in progress
+        # instead of starting another Modbus read
+        if self._inflight is None:
+            self._inflight = self.hass.async_create_task(self._async_fetch_data())
+            self._inflight.add_done_callback(self._clear_inflight)
+        else:
+            _LOGGER.debug("Data Coordinator: joining update in progress")
+        # a cancelled caller must not cancel the update shared with the others
+        return await asyncio.shield(self._inflight)
+
+    @callback
+    def _clear_inflight(self, _task: asyncio.Task) -> None:
+        """Forget the completed in-flight update."""
+        self._inflight = None
+
+    async def _async_fetch_data(self):
+        """Fetch data from the API."""
+        update_start = self.hass.loop.time()
+        _LOGGER.debug("Data Coordinator: Update started")
+        poll_slow = self._poll_count % SLOW_POLL_MULTIPLIER == 0
         try:
-            self.last_update_status = await self.api.async_get_data()
-            self.last_update_time = datetime.now()
+            self.last_update_status = await self.api.async_get_data(poll_slow)
+        except (SinapsiConnectionError, SinapsiModbusError, OSError) as ex:
+            self.last_update_status = False
+            # back off exponentially while the device keeps failing: the
+            # next refresh is scheduled with the updated interval
+            self._consecutive_failures += 1
+            self.update_interval = _clamped_interval(
+                self.scan_interval << min(self._consecutive_failures - 1, 6)
+            )
             _LOGGER.debug(
-                f"Data Coordinator: Update completed at {self.last_update_time}"
+                "Data Coordinator: %s consecutive failures, next update in %s",
+                self._consecutive_failures,
+                self.update_interval,
             )
-            return self.last_update_status
-        except Exception as ex:
-            self.last_update_status = False
-            _LOGGER.debug(f"Coordinator Update Error: {ex} at {self.last_update_time}")
-            raise UpdateFailed() from ex
+            # DataUpdateCoordinator logs the failure, no need to log it here
+            raise UpdateFailed(f"Update failed: {ex}") from ex
+        if self._consecutive_failures:
+            # device is back: restore the configured update interval
+            self._consecutive_failures = 0
+            self.update_interval = _clamped_interval(self.scan_interval)
+        self._poll_count += 1
+        self.last_update_time = dt_util.utcnow()
+        _LOGGER.debug(
+            "Data Coordinator: Update completed in %.3fs",
+            self.hass.loop.time() - update_start,
+        )
+        return self.last_update_status
@@ -4,55 +4,48 @@ https://github.com/alexdelprete/ha-sinapsi-alfa
 """
 
 import ipaddress
-import re
-import time
-from datetime import datetime, timedelta, timezone
+import string
+from datetime import datetime, tzinfo
+from functools import lru_cache
+
+from homeassistant.util import dt as dt_util
+
+# characters allowed in a hostname label
+_HOSTNAME_ALLOWED = (string.ascii_letters + string.digits + "-").encode()
 
 
 def host_valid(host):
-    """Return True if hostname or IP address is valid."""
-    try:
-        if ipaddress.ip_address(host).version == (4 or 6):
+    """Return True if hostname or IPv4 address is valid."""
+    # only parse as an address what can be one, hostnames skip the exception
+    if host[:1].isdigit():
+        try:
+            ipaddress.IPv4Address(host)
+        except ValueError:
+            pass  # hostname labels may start with a digit too
+        else:
             return True
-    except ValueError:
-        disallowed = re.compile(r"[^a-zA-Z\d\-]")
-        return all(x and not disallowed.search(x) for x in host.split("."))
-
+    # the API connects over IPv4 only: IPv6 addresses fail label validation
+    return all(_label_valid(x) for x in host.split("."))
 
-def get_local_timezone_offset() -> float:
-    """Get local timezone offset."""
-    # Get the current time in seconds since the epoch
-    current_time = time.time()
 
-    # Get the local timezone offset in seconds
-    local_timezone_offset_seconds = (
-        -time.timezone
-        if (time.localtime(current_time).tm_isdst == 0)
-        else -time.altzone
+def _label_valid(label: str) -> bool:
+    """Return True if label is a non-empty run of allowed hostname chars."""
+    # deleting the allowed bytes leaves nothing for a valid label
+    return (
+        bool(label)
+        and label.isascii()
+        and not label.encode().translate(None, _HOSTNAME_ALLOWED)
     )
 
-    # Convert the offset to hours
-    local_timezone_offset_hours = local_timezone_offset_seconds / 3600
-
-    return local_timezone_offset_hours
-
 
 def unix_timestamp_to_iso8601_local_tz(unix_timestamp: int) -> str:
     """Convert timestamp to ISO8601."""
+    # HA keeps its configured time zone current, no need to resolve it here
+    return _iso8601_in_tz(unix_timestamp, dt_util.DEFAULT_TIME_ZONE)
 
-    # Convert Unix timestamp to datetime object in UTC
-    dt_utc = datetime.utcfromtimestamp(unix_timestamp).replace(tzinfo=timezone.utc)  # noqa: UP017
-
-    # Get the local timezone offset
-    local_timezone_offset_hours = get_local_timezone_offset()
-
-    # Create a timezone object with the local offset
-    local_timezone = timezone(timedelta(hours=local_timezone_offset_hours))
-
-    # Convert UTC datetime to local datetime
-    dt_local = dt_utc.astimezone(local_timezone)
-
-    # Format local datetime object as ISO8601 string
-    iso8601_format = dt_local.isoformat()
 
-    return iso8601_format
+@lru_cache(maxsize=256)
+def _iso8601_in_tz(unix_timestamp: int, tz: tzinfo) -> str:
+    """Return the ISO8601 string of timestamp in tz."""
+    # the time zone is part of the key, so a zone change never hits stale entries
+    return datetime.fromtimestamp(unix_timestamp, tz).isoformat()
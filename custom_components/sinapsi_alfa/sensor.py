@@ -4,7 +4,6 @@ https://github.com/alexdelprete/ha-sinapsi-alfa
 """
 
 import logging
-from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.core import HomeAssistant, callback
@@ -16,6 +15,7 @@ from .const import (
     CONF_NAME,
     DOMAIN,
     SENSOR_ENTITIES,
+    SensorSpec,
 )
 from .coordinator import SinapsiAlfaCoordinator
 
@@ -35,128 +35,57 @@ async def async_setup_entry(
     _LOGGER.debug("(sensor) Model: %s", coordinator.api.data["model"])
     _LOGGER.debug("(sensor) Serial#: %s", coordinator.api.data["sn"])
 
-    sensors = []
-    for sensor in SENSOR_ENTITIES:
-        if coordinator.api.data[sensor["key"]] is not None:
-            sensors.append(
-                SinapsiAlfaSensor(
-                    coordinator,
-                    sensor["name"],
-                    sensor["key"],
-                    sensor["icon"],
-                    sensor["device_class"],
-                    sensor["state_class"],
-                    sensor["unit"],
-                )
-            )
+    # keys the device reported a value for
+    available = {
+        key for key, value in coordinator.api.data.items() if value is not None
+    }
+    sensors = [
+        SinapsiAlfaSensor(coordinator, sensor)
+        for sensor in SENSOR_ENTITIES
+        if sensor.key in available
+    ]
 
     async_add_entities(sensors)
 
-    return True
 
-
-class SinapsiAlfaSensor(CoordinatorEntity, SensorEntity):
+class SinapsiAlfaSensor(CoordinatorEntity[SinapsiAlfaCoordinator], SensorEntity):
     """Representation of a Sinapsi Alfa sensor."""
 
-    def __init__(self, coordinator, name, key, icon, device_class, state_class, unit):
+    # own fields live in slots, HA entity bases keep their __dict__
+    __slots__ = ("_key", "_last_available")
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, coordinator: SinapsiAlfaCoordinator, sensor: SensorSpec):
         """Class Initializitation."""
         super().__init__(coordinator)
-        self._coordinator = coordinator
-        self._name = name
-        self._key = key
-        self._icon = icon
-        self._device_class = device_class
-        self._state_class = state_class
-        self._unit_of_measurement = unit
-        self._device_name = self._coordinator.api.name
-        self._device_host = self._coordinator.api.host
-        self._device_model = self._coordinator.api.data["model"]
-        self._device_manufact = self._coordinator.api.data["manufact"]
-        self._device_sn = self._coordinator.api.data["sn"]
+        self._key = sensor.key
+        # static entity attributes, read by HA without a property call
+        self._attr_name = sensor.name
+        self._attr_icon = sensor.icon
+        self._attr_device_class = sensor.device_class
+        self._attr_state_class = sensor.state_class
+        self._attr_native_unit_of_measurement = sensor.unit
+        self._attr_entity_category = (
+            EntityCategory.DIAGNOSTIC if sensor.state_class is None else None
+        )
+        self._attr_unique_id = f"{DOMAIN}_{coordinator.api.data['sn']}_{sensor.key}"
+        # shared by every sensor of the device
+        self._attr_device_info = coordinator.device_info
+        # value only changes on coordinator updates, cache it for state reads
+        self._attr_native_value = coordinator.api.data.get(sensor.key)
+        # availability last written to the state machine
+        self._last_available = None
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Fetch new state data for the sensor."""
-        self._state = self._coordinator.api.data[self._key]
+        value = self.coordinator.api.data[self._key]
+        available = self.available
+        # unchanged sensors skip the state write and its state_changed event
+        if value == self._attr_native_value and available == self._last_available:
+            return
+        self._attr_native_value = value
+        self._last_available = available
         self.async_write_ha_state()
-        # write debug log only on first sensor to avoid spamming the log
-        if self.name == "Manufacturer":
-            _LOGGER.debug(
-                "_handle_coordinator_update: sensors state written to state machine"
-            )
-
-    @property
-    def has_entity_name(self):
-        """Return the name state."""
-        return True
-
-    @property
-    def name(self):
-        """Return the name."""
-        return f"{self._name}"
-
-    @property
-    def native_unit_of_measurement(self):
-        """Return the unit of measurement."""
-        return self._unit_of_measurement
-
-    @property
-    def icon(self):
-        """Return the sensor icon."""
-        return self._icon
-
-    @property
-    def device_class(self):
-        """Return the sensor device_class."""
-        return self._device_class
-
-    @property
-    def state_class(self):
-        """Return the sensor state_class."""
-        return self._state_class
-
-    @property
-    def entity_category(self):
-        """Return the sensor entity_category."""
-        if self._state_class is None:
-            return EntityCategory.DIAGNOSTIC
-        else:
-            return None
-
-    @property
-    def native_value(self):
-        """Return the state of the sensor."""
-        if self._key in self._coordinator.api.data:
-            return self._coordinator.api.data[self._key]
-        else:
-            return None
-
-    @property
-    def state_attributes(self) -> dict[str, Any] | None:
-        """Return the attributes."""
-        return None
-
-    @property
-    def should_poll(self) -> bool:
-        """No need to poll. Coordinator notifies entity of updates."""
-        return False
-
-    @property
-    def unique_id(self):
-        """Return a unique ID to use for this entity."""
-        return f"{DOMAIN}_{self._device_sn}_{self._key}"
-
-    @property
-    def device_info(self):
-        """Return device specific attributes."""
-        return {
-            "configuration_url": f"http://{self._device_host}",
-            "hw_version": None,
-            "identifiers": {(DOMAIN, self._device_sn)},
-            "manufacturer": self._device_manufact,
-            "model": self._device_model,
-            "name": self._device_name,
-            "serial_number": self._device_sn,
-            "sw_version": None,
-            "via_device": None,
-        }